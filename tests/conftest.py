@@ -1,14 +1,16 @@
 """Test configuration and fixtures for pytest unit testing workshop."""
 
-import os
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from datetime import datetime
+from functools import lru_cache
+from types import SimpleNamespace
 from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from project.config import Settings
 from project.db.models.base import Base
@@ -16,12 +18,31 @@ from project.db.models.task import Task, TaskStatus
 from project.db.models.user import Role, User
 from project.security import encrypt_password
 
+USER_ROLE = Role.USER.value
+ADMIN_ROLE = Role.ADMIN.value
+TODO_STATUS = TaskStatus.TODO.value
+
+
+@lru_cache
+def cached_password_hash(password: str) -> str:
+    """
+    Hash a password once per session; bcrypt is slow by design.
+
+    The cache only pays off when callers reuse the same password, so pass a
+    distinct one only if a test actually verifies it.
+    """
+    return encrypt_password(password)
+
+
 # =============================================================================
 # UNIT TEST FIXTURES (no database, mocks only)
 # =============================================================================
+# These are session-scoped and shared between tests: read them, don't mutate
+# them. They are plain attribute bags (SimpleNamespace); use mock_user_factory
+# or mock_task_factory if you need call tracking or to change attributes.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_settings() -> Settings:
     """Provide test settings without loading from .env."""
     return Settings(
@@ -34,46 +55,96 @@ def test_settings() -> Settings:
     )
 
 
-@pytest.fixture
-def sample_user() -> Mock:
-    """Create a sample user mock for testing (not persisted to DB)."""
-    user = Mock(spec=User)
-    user.uuid = uuid4()
-    user.username = "testuser"
-    user.email = "test@example.com"
-    user.password_hash = "$2b$12$test_hash_placeholder"
-    user.role = Role.USER.value
-    user.created_at = datetime.now()
-    return user
+@pytest.fixture(scope="session")
+def sample_user() -> SimpleNamespace:
+    """Create a sample user stand-in for testing (not persisted to DB)."""
+    return SimpleNamespace(
+        uuid=uuid4(),
+        username="testuser",
+        email="test@example.com",
+        password_hash="$2b$12$test_hash_placeholder",
+        role=USER_ROLE,
+        created_at=datetime.now(),
+    )
+
+
+@pytest.fixture(scope="session")
+def admin_user() -> SimpleNamespace:
+    """Create an admin user stand-in for testing (not persisted to DB)."""
+    return SimpleNamespace(
+        uuid=uuid4(),
+        username="admin",
+        email="admin@example.com",
+        password_hash="$2b$12$admin_hash_placeholder",
+        role=ADMIN_ROLE,
+        created_at=datetime.now(),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_task(sample_user: SimpleNamespace) -> SimpleNamespace:
+    """Create a sample task stand-in for testing (not persisted to DB)."""
+    return SimpleNamespace(
+        uuid=uuid4(),
+        title="Test Task",
+        description="A test task description",
+        status=TODO_STATUS,
+        priority=3,
+        due_date=None,
+        created_by=sample_user.uuid,
+        assigned_to=None,
+        created_at=datetime.now(),
+    )
+
+
+@pytest.fixture(scope="session")
+def user_spec() -> list[str]:
+    """Attribute names of User, computed once for spec'd user mocks."""
+    return dir(User)
+
+
+@pytest.fixture(scope="session")
+def task_spec() -> list[str]:
+    """Attribute names of Task, computed once for spec'd task mocks."""
+    return dir(Task)
 
 
 @pytest.fixture
-def admin_user() -> Mock:
-    """Create an admin user mock for testing (not persisted to DB)."""
-    user = Mock(spec=User)
-    user.uuid = uuid4()
-    user.username = "admin"
-    user.email = "admin@example.com"
-    user.password_hash = "$2b$12$admin_hash_placeholder"
-    user.role = Role.ADMIN.value
-    user.created_at = datetime.now()
-    return user
+def mock_user_factory(user_spec: list[str]) -> Callable[..., Mock]:
+    """
+    Factory fixture for User mocks restricted to User's attribute names.
+
+    Usage:
+        def test_something(mock_user_factory):
+            mock_user = mock_user_factory(username="testuser")
+    """
+
+    def make_mock_user(**attrs) -> Mock:
+        return Mock(spec_set=user_spec, **attrs)
+
+    return make_mock_user
 
 
 @pytest.fixture
-def sample_task(sample_user: Mock) -> Mock:
-    """Create a sample task mock for testing (not persisted to DB)."""
-    task = Mock(spec=Task)
-    task.uuid = uuid4()
-    task.title = "Test Task"
-    task.description = "A test task description"
-    task.status = TaskStatus.TODO.value
-    task.priority = 3
-    task.due_date = None
-    task.created_by = sample_user.uuid
-    task.assigned_to = None
-    task.created_at = datetime.now()
-    return task
+def mock_task_factory(task_spec: list[str]) -> Callable[..., Mock]:
+    """Factory fixture for Task mocks restricted to Task's attribute names."""
+
+    def make_mock_task(**attrs) -> Mock:
+        return Mock(spec_set=task_spec, **attrs)
+
+    return make_mock_task
+
+
+@pytest.fixture(scope="session")
+def known_password_hash() -> tuple[str, str]:
+    """Provide a (password, bcrypt hash) pair, hashed once per session."""
+    return "mypassword", cached_password_hash("mypassword")
+
+
+@pytest.fixture(scope="session")
+def other_password_hash() -> tuple[str, str]:
+    """Provide a pair for a different password than known_password_hash."""
+    return "correctpassword", cached_password_hash("correctpassword")
 
 
 # =============================================================================
@@ -81,53 +152,56 @@ def sample_task(sample_user: Mock) -> Mock:
 # =============================================================================
 
 
-def get_worker_id() -> str:
-    """Get xdist worker id for parallel test isolation."""
-    return os.environ.get("PYTEST_XDIST_WORKER", "master")
-
-
 def create_test_engine() -> Engine:
-    """Create a fresh SQLite test database engine."""
-    worker_id = get_worker_id()
-    db_file = f"test_{worker_id}_{uuid4().hex}.sqlite"
+    """Create a fresh in-memory SQLite test database with all tables.
 
+    StaticPool keeps a single connection, so every session on this engine
+    shares the same in-memory database, and the connection setup below runs
+    only once instead of on every checkout.
+    """
     engine = create_engine(
-        f"sqlite:///{db_file}",
+        "sqlite://",
         echo=False,
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
 
-    return engine
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_conn, _):
+        # let SQLAlchemy emit BEGIN itself so SAVEPOINTs behave under pysqlite
+        dbapi_conn.isolation_level = None
 
+        # keep temporary tables and indices in memory instead of temp files
+        dbapi_conn.execute("PRAGMA temp_store=MEMORY")
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
-def setup_test_database(engine: Engine) -> None:
-    """Create all tables in the test database."""
     Base.metadata.create_all(bind=engine)
 
+    return engine
 
-def teardown_test_database(engine: Engine) -> None:
-    """Drop all tables and cleanup the test database file."""
-    engine.dispose()
 
-    db_url = str(engine.url)
-    if db_url.startswith("sqlite:///") and db_url != "sqlite:///:memory:":
-        db_file = db_url[10:]
-        for suffix in ["", "-journal", "-wal", "-shm"]:
-            file_path = db_file + suffix
-            if os.path.exists(file_path):
-                try:
-                    os.unlink(file_path)
-                except Exception:
-                    pass
+@pytest.fixture(scope="session")
+def db_engine() -> Generator[Engine, None, None]:
+    """Create the test database and its schema once per test session."""
+    engine = create_test_engine()
+    try:
+        yield engine
+    finally:
+        # disposing the only connection discards the in-memory database
+        engine.dispose()
 
 
 @pytest.fixture
-def db_session() -> Generator[Session, None, None]:
+def db_session(db_engine: Engine) -> Generator[Session, None, None]:
     """
     Database session fixture for integration tests.
 
-    Creates a fresh SQLite database for each test, with all tables.
-    Auto-tears down after the test completes.
+    Runs each test inside an outer transaction that is rolled back afterwards,
+    so every test sees an empty database without rebuilding the schema.
+    Calls to session.commit() only release a SAVEPOINT inside that transaction.
 
     Usage:
         def test_something(db_session: Session):
@@ -136,45 +210,68 @@ def db_session() -> Generator[Session, None, None]:
             db_session.add(user)
             db_session.commit()
     """
-    engine = create_test_engine()
-    setup_test_database(engine)
+    connection = db_engine.connect()
+    transaction = connection.begin()
+
+    # expire_on_commit=False keeps fixture objects loaded after commit(), so
+    # reading their attributes doesn't re-SELECT the row
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+    yield session
+
+    # no session.rollback() needed: the outer rollback discards all test writes
+    session.close()
+    transaction.rollback()
+    connection.close()
+
 
-    with Session(engine) as session:
-        yield session
-        session.rollback()
+@pytest.fixture
+def user_factory(db_session: Session) -> Callable[..., User]:
+    """
+    Factory fixture that adds users to the test session.
+
+    Users are added but not flushed, so several can be created and written
+    with a single flush/commit. All of them share the cached hash of
+    "testpass123", so the factory runs bcrypt at most once per session.
+
+    Usage:
+        def test_something(db_session: Session, user_factory):
+            user1 = user_factory("user1")
+            admin = user_factory("admin", role=Role.ADMIN.value)
+            db_session.flush()
+    """
 
-    teardown_test_database(engine)
+    def make_user(username: str, role: str = USER_ROLE, **kwargs) -> User:
+        user = User(
+            uuid=uuid4(),
+            username=username,
+            email=f"{username}@example.com",
+            password_hash=cached_password_hash("testpass123"),
+            role=role,
+            **kwargs,
+        )
+        db_session.add(user)
+        return user
+
+    return make_user
 
 
 @pytest.fixture
-def created_user(db_session: Session) -> User:
+def created_user(db_session: Session, user_factory: Callable[..., User]) -> User:
     """Create and persist a test user in the database."""
-    user = User(
-        uuid=uuid4(),
-        username="testuser",
-        email="testuser@example.com",
-        password_hash=encrypt_password("testpass123"),
-        role=Role.USER.value,
-    )
-    db_session.add(user)
+    user = user_factory("testuser")
     db_session.commit()
-    db_session.refresh(user)
     return user
 
 
 @pytest.fixture
-def created_admin(db_session: Session) -> User:
+def created_admin(db_session: Session, user_factory: Callable[..., User]) -> User:
     """Create and persist an admin user in the database."""
-    admin = User(
-        uuid=uuid4(),
-        username="admin",
-        email="admin@example.com",
-        password_hash=encrypt_password("adminpass123"),
-        role=Role.ADMIN.value,
-    )
-    db_session.add(admin)
+    admin = user_factory("admin", role=ADMIN_ROLE)
     db_session.commit()
-    db_session.refresh(admin)
     return admin
 
 
@@ -185,11 +282,10 @@ def created_task(db_session: Session, created_user: User) -> Task:
         uuid=uuid4(),
         title="Test Task",
         description="A test task for integration tests",
-        status=TaskStatus.TODO.value,
+        status=TODO_STATUS,
         priority=3,
         created_by=created_user.uuid,
     )
     db_session.add(task)
     db_session.commit()
-    db_session.refresh(task)
     return task
@@ -10,7 +10,7 @@ Integration tests verify that multiple components work together correctly:
 - Data integrity is maintained
 
 Key differences from unit tests:
-- Uses real SQLite database (created fresh per test)
+- Uses real SQLite database (rolled back after each test)
 - No mocking of database session
 - Tests actual query execution
 - Slower than unit tests, but higher confidence
@@ -23,12 +23,12 @@ Run these tests:
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
-from project.db.models.task import Task, TaskStatus, TaskUpdate, TaskCreate
-from project.db.models.user import Role, User
+from project.db.models.task import Task, TaskCreate, TaskStatus, TaskUpdate
+from project.db.models.user import Role, User, UserCreate
 from project.exceptions import EntityNotFoundError
-from project.security import encrypt_password
 from project.services import task_service, user_service
 from project.utils.pagination import PaginationParams
 
@@ -51,24 +51,16 @@ class TestLevel4:
     # TEST 1: Service Query Execution
     # WHY: Verify service queries actually work against a real database
     # =========================================================================
-    def test_user_service_creates_and_retrieves_user(self, db_session: Session):
+    @pytest.mark.slow
+    def test_user_service_creates_and_retrieves_user(self, db_session: Session, user_factory):
         """Test user creation and retrieval through service layer.
 
         Real-world: This tests the full flow from service → ORM → database → ORM.
         Unlike unit tests, this catches SQL syntax errors and ORM mapping issues.
         """
-        from project.db.models.user import UserCreate
-
         # arrange: create admin for audit fields
-        admin = User(
-            uuid=uuid4(),
-            username="admin",
-            email="admin@test.com",
-            password_hash=encrypt_password("admin123"),
-            role=Role.ADMIN.value,
-        )
-        db_session.add(admin)
-        db_session.commit()
+        user_factory("admin", role=Role.ADMIN.value)
+        db_session.flush()
 
         # act: create user through service
         user_data = UserCreate(
@@ -100,17 +92,19 @@ class TestLevel4:
         Real-world: Pagination logic can have off-by-one errors, wrong totals,
         or ordering issues that only appear with real database queries.
         """
-        # arrange: create 15 tasks
-        for i in range(15):
-            task = Task(
-                uuid=uuid4(),
-                title=f"Task {i:02d}",
-                description=f"Description for task {i}",
-                status=TaskStatus.TODO.value,
-                priority=(i % 5) + 1,
-                created_by=created_user.uuid,
-            )
-            db_session.add(task)
+        # arrange: bulk insert 15 tasks (rows only, no ORM objects needed)
+        base_row = {"status": TaskStatus.TODO.value, "created_by": created_user.uuid}
+        rows = [
+            base_row
+            | {
+                "uuid": uuid4(),
+                "title": f"Task {i:02d}",
+                "description": f"Description for task {i}",
+                "priority": (i % 5) + 1,
+            }
+            for i in range(15)
+        ]
+        db_session.execute(insert(Task), rows)
         db_session.commit()
 
         # act: get first page
@@ -147,29 +141,16 @@ class TestLevel4:
     # TEST 3: Filtering Across Relationships
     # WHY: Complex queries with JOINs can fail in subtle ways
     # =========================================================================
-    def test_task_filtering_by_status_and_assignment(self, db_session: Session):
+    def test_task_filtering_by_status_and_assignment(self, db_session: Session, user_factory):
         """Test filtering tasks by status and assigned user.
 
         Real-world: Filtering logic with foreign keys needs to work correctly
         when the FK is NULL vs when it points to a specific user.
         """
         # arrange: create two users
-        user1 = User(
-            uuid=uuid4(),
-            username="user1",
-            email="user1@test.com",
-            password_hash=encrypt_password("pass1"),
-            role=Role.USER.value,
-        )
-        user2 = User(
-            uuid=uuid4(),
-            username="user2",
-            email="user2@test.com",
-            password_hash=encrypt_password("pass2"),
-            role=Role.USER.value,
-        )
-        db_session.add_all([user1, user2])
-        db_session.commit()
+        user1 = user_factory("user1")
+        user2 = user_factory("user2")
+        db_session.flush()
 
         # create tasks with different statuses and assignments
         tasks_data = [
@@ -180,16 +161,18 @@ class TestLevel4:
             ("Task E", TaskStatus.TODO, user1.uuid, None),  # todo, unassigned
         ]
 
-        for title, status, created_by, assigned_to in tasks_data:
-            task = Task(
-                uuid=uuid4(),
-                title=title,
-                status=status.value,
-                priority=3,
-                created_by=created_by,
-                assigned_to=assigned_to,
-            )
-            db_session.add(task)
+        rows = [
+            {
+                "uuid": uuid4(),
+                "title": title,
+                "status": status.value,
+                "priority": 3,
+                "created_by": created_by,
+                "assigned_to": assigned_to,
+            }
+            for title, status, created_by, assigned_to in tasks_data
+        ]
+        db_session.execute(insert(Task), rows)
         db_session.commit()
 
         # act: filter by status=TODO
@@ -255,8 +238,6 @@ class TestLevel4:
         Real-world: CRUD operations must leave the database in a consistent state.
         This test verifies the full lifecycle of an entity.
         """
-        from project.db.models.task import TaskCreate, TaskUpdate
-
         # CREATE
         task_data = TaskCreate(
             title="Lifecycle Test Task",
@@ -317,6 +298,7 @@ class TestLevel4Exercises:
     Complete these tests following the same patterns.
     """
 
+    @pytest.mark.slow
     def test_get_users_returns_all_active_users(self, db_session: Session) -> None:
         """Exercise: Test user listing with active filter.
 
@@ -324,8 +306,6 @@ class TestLevel4Exercises:
         - Call get_all_users(db_session)
         - Verify all created users are returned
         """
-        from project.db.models.user import UserCreate
-
         # act: create user through service
         user_data_1 = UserCreate(
             username="newuser1",
@@ -81,6 +81,7 @@ class TestTaskCreateSchema:
 
 @pytest.mark.unit
 @pytest.mark.level_1
+@pytest.mark.slow
 class TestPasswordEncryption:
     """Example: Test pure function behavior."""
 
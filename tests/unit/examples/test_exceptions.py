@@ -17,7 +17,7 @@ import pytest
 from pydantic import ValidationError as PydanticValidationError
 
 from project.db.models.task import TaskCreate
-from project.exceptions import EntityNotFoundError
+from project.exceptions import EntityNotFoundError, ServiceError
 from project.utils.pagination import PaginationParams
 
 # =============================================================================
@@ -30,28 +30,23 @@ from project.utils.pagination import PaginationParams
 class TestPaginationParamsValidation:
     """Example: Test Pydantic validation raises on invalid input."""
 
-    def test_pagination_rejects_negative_offset(self):
-        """PaginationParams should reject negative offset."""
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_loc"),
+        [
+            ({"offset": -1}, ("offset",)),
+            ({"limit": 0}, ("limit",)),
+            ({"limit": 101}, ("limit",)),
+        ],
+    )
+    def test_pagination_rejects(self, kwargs, expected_loc):
+        """PaginationParams should reject out-of-range offset and limit."""
         with pytest.raises(PydanticValidationError) as exc_info:
-            PaginationParams(offset=-1)
+            PaginationParams(**kwargs)
 
         # check error details
         errors = exc_info.value.errors()
         assert len(errors) == 1
-        assert errors[0]["loc"] == ("offset",)
-
-    def test_pagination_rejects_zero_limit(self):
-        """PaginationParams should reject zero limit."""
-        with pytest.raises(PydanticValidationError) as exc_info:
-            PaginationParams(limit=0)
-
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("limit",) for e in errors)
-
-    def test_pagination_rejects_excessive_limit(self):
-        """PaginationParams should reject limit > 100."""
-        with pytest.raises(PydanticValidationError):
-            PaginationParams(limit=101)
+        assert errors[0]["loc"] == expected_loc
 
 
 @pytest.mark.unit
@@ -61,30 +56,23 @@ class TestTaskCreateValidation:
 
     def test_task_create_rejects_empty_title(self):
         """TaskCreate should reject empty title."""
-        with pytest.raises(PydanticValidationError) as exc_info:
+        # match= searches the error message, where the field name has its own line
+        with pytest.raises(PydanticValidationError, match=r"(?m)^title$"):
             TaskCreate(title="")
 
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == ("title",) for e in errors)
-
-    def test_task_create_rejects_priority_below_1(self):
-        """TaskCreate should reject priority < 1."""
+    @pytest.mark.parametrize("priority", [0, 6])
+    def test_task_create_rejects_out_of_range_priority(self, priority):
+        """TaskCreate should reject priority < 1 and > 5."""
         with pytest.raises(PydanticValidationError):
-            TaskCreate(title="Test", priority=0)
+            TaskCreate(title="Test", priority=priority)
 
-    def test_task_create_rejects_priority_above_5(self):
-        """TaskCreate should reject priority > 5."""
-        with pytest.raises(PydanticValidationError):
-            TaskCreate(title="Test", priority=6)
-
-    def test_task_create_accepts_boundary_priorities(self):
+    @pytest.mark.parametrize("priority", [1, 5])
+    def test_task_create_accepts_boundary_priorities(self, priority):
         """TaskCreate should accept priority 1 and 5."""
         # these should NOT raise
-        task_low = TaskCreate(title="Low Priority", priority=1)
-        task_high = TaskCreate(title="High Priority", priority=5)
+        task = TaskCreate(title="Boundary Priority", priority=priority)
 
-        assert task_low.priority == 1
-        assert task_high.priority == 5
+        assert task.priority == priority
 
 
 @pytest.mark.unit
@@ -97,8 +85,6 @@ class TestEntityNotFoundError:
         error = EntityNotFoundError("User", "123")
 
         # isinstance checks inheritance
-        from project.exceptions import ServiceError
-
         assert isinstance(error, ServiceError)
 
     def test_entity_not_found_stores_entity_type(self):
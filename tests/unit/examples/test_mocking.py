@@ -14,17 +14,20 @@ Run these tests:
     pytest -k level_3 -v
 """
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
-from uuid import uuid4
 
 import pytest
 
-from project.db.models.task import Task
-from project.db.models.user import User
 from project.exceptions import EntityNotFoundError
 from project.security import TokenPayload, create_access_token, verify_password
+from project.services.task_service import get_tasks
+from project.services.user_service import get_user_by_username
 from project.utils.pagination import PaginatedData, PaginationParams
 
+# opaque user id for token payloads; uniqueness is never asserted
+TEST_USER_UUID = "00000000-0000-0000-0000-000000000001"
+
 # =============================================================================
 # EXAMPLE TESTS - Study these patterns
 # =============================================================================
@@ -35,20 +38,16 @@ from project.utils.pagination import PaginatedData, PaginationParams
 class TestServiceWithMockedSession:
     """Example: Mock SQLAlchemy Session to test service functions."""
 
-    def test_get_user_by_username_with_mock_session(self):
+    def test_get_user_by_username_with_mock_session(self, mock_user_factory):
         """Test user lookup with mocked database session."""
         # arrange: create mock session and user
         mock_session = Mock()
-        mock_user = Mock(spec=User)
-        mock_user.username = "testuser"
-        mock_user.email = "test@example.com"
+        mock_user = mock_user_factory(username="testuser", email="test@example.com")
 
-        # configure mock to return user
-        mock_session.execute.return_value.scalar_one_or_none.return_value = mock_user
+        # configure mock to return user (dotted keys set the whole chain at once)
+        mock_session.configure_mock(**{"execute.return_value.scalar_one_or_none.return_value": mock_user})
 
         # act: call the service function
-        from project.services.user_service import get_user_by_username
-
         result = get_user_by_username(mock_session, "testuser")
 
         # assert: verify result and that session was called correctly
@@ -59,11 +58,9 @@ class TestServiceWithMockedSession:
         """Test that service raises EntityNotFoundError when user missing."""
         # arrange: mock session returns None
         mock_session = Mock()
-        mock_session.execute.return_value.scalar_one_or_none.return_value = None
+        mock_session.configure_mock(**{"execute.return_value.scalar_one_or_none.return_value": None})
 
         # act & assert
-        from project.services.user_service import get_user_by_username
-
         with pytest.raises(EntityNotFoundError) as exc_info:
             get_user_by_username(mock_session, "nonexistent")
 
@@ -76,42 +73,49 @@ class TestTokenCreationWithPatchedSettings:
     """Example: Patch get_settings to control configuration."""
 
     @patch("project.security.get_settings")
-    def test_create_access_token_uses_settings(self, mock_get_settings):
+    @patch("project.security.jwt.encode", return_value="stub")
+    def test_create_access_token_uses_settings(self, mock_encode, mock_get_settings):
         """Test that create_access_token uses settings for JWT encoding."""
-        # arrange: mock settings
-        mock_settings = Mock()
-        mock_settings.SECRET_KEY = "test-secret"
-        mock_settings.ALGORITHM = "HS256"
-        mock_settings.ACCESS_TOKEN_EXPIRE_MINUTES = 60
+        # arrange: plain attribute bag for settings, no call tracking needed
+        mock_settings = SimpleNamespace(
+            SECRET_KEY="test-secret",
+            ALGORITHM="HS256",
+            ACCESS_TOKEN_EXPIRE_MINUTES=60,
+        )
         mock_get_settings.return_value = mock_settings
 
         payload = TokenPayload(
             username="testuser",
             role="user",
-            user_uuid=str(uuid4()),
+            user_uuid=TEST_USER_UUID,
         )
 
         # act
         token = create_access_token(payload)
 
         # assert
-        assert token.access_token is not None
+        assert token.access_token == "stub"
         assert token.token_type == "bearer"
         mock_get_settings.assert_called()
 
+        # settings values are passed through to jwt.encode
+        assert mock_encode.call_args[0][1] == "test-secret"
+        assert mock_encode.call_args[1]["algorithm"] == "HS256"
+
     @patch("project.security.get_settings")
     @patch("project.security.jwt.encode")
     def test_create_access_token_payload_structure(self, mock_encode, mock_get_settings):
         """Test that JWT payload contains expected fields."""
         # arrange
-        mock_settings = Mock()
-        mock_settings.SECRET_KEY = "test-secret"
-        mock_settings.ALGORITHM = "HS256"
-        mock_settings.ACCESS_TOKEN_EXPIRE_MINUTES = 30
+        mock_settings = SimpleNamespace(
+            SECRET_KEY="test-secret",
+            ALGORITHM="HS256",
+            ACCESS_TOKEN_EXPIRE_MINUTES=30,
+        )
         mock_get_settings.return_value = mock_settings
         mock_encode.return_value = "mock-token"
 
-        user_uuid = str(uuid4())
+        user_uuid = TEST_USER_UUID
         payload = TokenPayload(
             username="john",
             role="admin",
@@ -133,23 +137,19 @@ class TestTokenCreationWithPatchedSettings:
 
 @pytest.mark.unit
 @pytest.mark.level_3
+@pytest.mark.slow
 class TestPasswordVerificationWithMock:
     """Example: Test password verification (uses real bcrypt, no mock needed)."""
 
-    def test_verify_password_correct(self):
+    def test_verify_password_correct(self, known_password_hash):
         """Test verify_password returns True for correct password."""
-        from project.security import encrypt_password
-
-        password = "mypassword"
-        hashed = encrypt_password(password)
+        password, hashed = known_password_hash
 
         assert verify_password(password, hashed) is True
 
-    def test_verify_password_incorrect(self):
+    def test_verify_password_incorrect(self, other_password_hash):
         """Test verify_password returns False for wrong password."""
-        from project.security import encrypt_password
-
-        hashed = encrypt_password("correctpassword")
+        _, hashed = other_password_hash
 
         assert verify_password("wrongpassword", hashed) is False
 
@@ -159,27 +159,23 @@ class TestPasswordVerificationWithMock:
 class TestTaskServiceWithMockedSession:
     """Example: Test task service with comprehensive mocking."""
 
-    def test_get_tasks_with_pagination(self):
+    def test_get_tasks_with_pagination(self, mock_task_factory):
         """Test get_tasks applies pagination correctly."""
         # arrange
         mock_session = Mock()
 
         # create mock tasks
-        mock_task1 = Mock(spec=Task)
-        mock_task1.title = "Task 1"
-        mock_task2 = Mock(spec=Task)
-        mock_task2.title = "Task 2"
+        mock_task1 = mock_task_factory(title="Task 1")
+        mock_task2 = mock_task_factory(title="Task 2")
 
         # mock the query chain
-        mock_scalars = Mock()
-        mock_scalars.all.return_value = [mock_task1, mock_task2]
-        mock_session.execute.return_value.scalars.return_value = mock_scalars
+        mock_session.configure_mock(
+            **{"execute.return_value.scalars.return_value.all.return_value": [mock_task1, mock_task2]}
+        )
 
         pagination = PaginationParams(limit=10, offset=0)
 
         # act
-        from project.services.task_service import get_tasks
-
         result = get_tasks(mock_session, pagination)
 
         # assert
@@ -58,6 +58,7 @@ class TestLevel1:
     # TEST 2: Password Hashing Security
     # WHY: Critical security test - passwords must be hashed, never stored plain
     # =========================================================================
+    @pytest.mark.slow
     def test_password_encryption_is_secure(self):
         """Test that password encryption produces verifiable, unique hashes.
 
@@ -96,7 +97,7 @@ class TestLevel1:
 
         This test verifies from_attributes=True works with your models.
         """
-        # sample_user is a Mock with ORM-like attributes
+        # sample_user is a stand-in object with ORM-like attributes
         response = UserResponse.model_validate(sample_user)
 
         assert response.uuid == sample_user.uuid
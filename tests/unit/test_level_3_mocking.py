@@ -18,8 +18,12 @@ from fastapi import HTTPException
 
 from project.db.models.task import Task
 from project.db.models.user import Role, User
+from project.dependencies import get_current_user, require_admin
 from project.exceptions import AuthenticationError, EntityNotFoundError
-from project.security import TokenData, TokenPayload
+from project.security import TokenData, TokenPayload, create_access_token
+from project.services.auth_service import authenticate_user
+from project.services.task_service import get_task_by_uuid
+from project.services.user_service import get_user_by_username
 
 
 @pytest.mark.unit
@@ -46,8 +50,6 @@ class TestLevel3:
         Real-world: You want to test your service logic (query building,
         result processing) without spinning up a test database.
         """
-        from project.services.user_service import get_user_by_username
-
         # arrange: create mock session and user
         mock_session = Mock()
         mock_user = Mock(spec=User)
@@ -77,8 +79,6 @@ class TestLevel3:
         Real-world: When session.scalar_one_or_none() returns None,
         your service should raise EntityNotFoundError, not return None.
         """
-        from project.services.user_service import get_user_by_username
-
         # arrange: mock session returns None (user not found)
         mock_session = Mock()
         mock_session.execute.return_value.scalar_one_or_none.return_value = None
@@ -101,8 +101,6 @@ class TestLevel3:
         Real-world: Test that your auth code correctly uses settings
         like SECRET_KEY and ALGORITHM without requiring .env file.
         """
-        from project.security import create_access_token
-
         # arrange: mock settings
         mock_settings = Mock()
         mock_settings.SECRET_KEY = "test-secret-key"
@@ -138,8 +136,6 @@ class TestLevel3:
         - Looks up the user from decoded username
         - Returns the user object
         """
-        from project.dependencies import get_current_user
-
         # arrange: mock token decode and user lookup
         mock_decode.return_value = TokenData(username="testuser")
         mock_user = Mock(spec=User)
@@ -165,8 +161,6 @@ class TestLevel3:
         Real-world: Admin-only endpoints must reject regular users
         with HTTP 403, but allow admin users through.
         """
-        from project.dependencies import require_admin
-
         # non-admin user should be rejected
         with pytest.raises(HTTPException) as exc_info:
             require_admin(sample_user)
@@ -201,8 +195,6 @@ class TestLevel3Exercises:
         - Call get_task_by_uuid(session, some_uuid)
         - Verify it returns the mock task
         """
-        from project.services.task_service import get_task_by_uuid
-
         # arrange: create mock session and user
         mock_session = Mock()
         mock_task = Mock(spec=Task)
@@ -229,8 +221,6 @@ class TestLevel3Exercises:
         - Call get_task_by_uuid
         - Verify EntityNotFoundError is raised with entity_type="Task"
         """
-        from project.services.task_service import get_task_by_uuid
-
         mock_session = Mock()
         mock_session.execute.return_value.scalar_one_or_none.return_value = None
 
@@ -255,8 +245,6 @@ class TestLevel3Exercises:
         - mock_verify returns False
         - Verify AuthenticationError is raised
         """
-        from project.services.auth_service import authenticate_user
-
         # arrange: create mock session and user
         mock_session = Mock()
         mock_user = Mock(spec=User)
@@ -273,5 +261,5 @@ class TestLevel3Exercises:
 
         mock_verify.return_value = False
 
-        with pytest.raises(AuthenticationError) as exc_info:
+        with pytest.raises(AuthenticationError):
             authenticate_user(mock_session, "testuser", "wrongpassword")